@@ -24,10 +24,14 @@ from pathlib import Path
 
 import yaml
 
-from generators.companion_generator import CompanionGenerator
-from generators.qlab_generator import QLabGenerator
-from generators.touchdesigner_generator import TouchDesignerGenerator
-from generators.checklist_generator import ChecklistGenerator
+try:
+    from yaml import CSafeLoader as _Loader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+# OSC address prefixes routed by the Production Hub
+KNOWN_PREFIXES = ("/avantis", "/lights", "/obs", "/cam", "/td", "/fade", "/system")
 
 
 # ─── Helpers ────────────────────────────────────────────────────────────────
@@ -39,8 +43,8 @@ def load_event(yaml_path: str) -> dict:
         print(f"Error: Template file not found: {yaml_path}")
         sys.exit(1)
 
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_Loader)
 
     # Basic validation
     required_keys = ["event_type", "cues"]
@@ -49,14 +53,20 @@ def load_event(yaml_path: str) -> dict:
             print(f"Error: Missing required key '{key}' in template")
             sys.exit(1)
 
-    # Validate hub_actions
-    known_prefixes = ["/avantis", "/lights", "/obs", "/cam", "/td", "/fade", "/system"]
+    # Validate hub_actions. Addresses, types and timings repeat across cues,
+    # so they are interned here to share one string object per value.
     has_hub_actions = False
     for cue in data.get("cues", []):
+        for key in ("type", "timing"):
+            value = cue.get(key)
+            if isinstance(value, str):
+                cue[key] = sys.intern(value)
         for action in cue.get("hub_actions", []):
             has_hub_actions = True
             address = action.get("address", "")
-            if not any(address.startswith(p) for p in known_prefixes):
+            if address:
+                address = action["address"] = sys.intern(address)
+            if not address.startswith(KNOWN_PREFIXES):
                 print(f"  Warning: cue {cue.get('id')}: hub_action address "
                       f"'{address}' does not match any known hub prefix")
 
@@ -67,6 +77,11 @@ def load_event(yaml_path: str) -> dict:
     return data
 
 
+def run_generator(gen_cls, event: dict, output_path: str) -> str:
+    """Instantiate a generator for the event and write its output file."""
+    return gen_cls(event).write(output_path)
+
+
 def ensure_output_dir(output_dir: str) -> Path:
     """Create the output directory if it doesn't exist."""
     path = Path(output_dir)
@@ -123,37 +138,59 @@ Examples:
     targets = args.only or ["companion", "qlab", "touchdesigner", "checklist"]
     generated = []
 
+    # Each job: (summary label, progress message, generator class, filename).
+    # Generators share no mutable state, so they run concurrently. Generator
+    # modules are imported only for the selected targets.
+    jobs = []
+
     # ── Companion ──
     if "companion" in targets:
-        print("Generating Companion page layout...")
-        gen = CompanionGenerator(event)
-        path = gen.write(str(out / f"{event_type}_companion.json"))
-        generated.append(("Companion JSON", path))
-        print(f"  -> {path}")
+        from generators.companion_generator import CompanionGenerator
+        jobs.append(("Companion JSON", "Generating Companion page layout...",
+                     CompanionGenerator, f"{event_type}_companion.json"))
 
     # ── QLab ──
     if "qlab" in targets:
-        print("Generating QLab OSC cue builder...")
-        gen = QLabGenerator(event)
-        path = gen.write(str(out / f"{event_type}_qlab_cues.py"))
-        generated.append(("QLab Script", path))
-        print(f"  -> {path}")
+        from generators.qlab_generator import QLabGenerator
+        jobs.append(("QLab Script", "Generating QLab OSC cue builder...",
+                     QLabGenerator, f"{event_type}_qlab_cues.py"))
 
     # ── TouchDesigner ──
     if "touchdesigner" in targets:
-        print("Generating TouchDesigner setup script...")
-        gen = TouchDesignerGenerator(event)
-        path = gen.write(str(out / f"{event_type}_touchdesigner_setup.py"))
-        generated.append(("TouchDesigner Script", path))
-        print(f"  -> {path}")
+        from generators.touchdesigner_generator import TouchDesignerGenerator
+        jobs.append(("TouchDesigner Script", "Generating TouchDesigner setup script...",
+                     TouchDesignerGenerator, f"{event_type}_touchdesigner_setup.py"))
 
     # ── Checklist ──
     if "checklist" in targets:
-        print("Generating setup checklist...")
-        gen = ChecklistGenerator(event)
-        path = gen.write(str(out / f"{event_type}_checklist.md"))
-        generated.append(("Setup Checklist", path))
+        from generators.checklist_generator import ChecklistGenerator
+        jobs.append(("Setup Checklist", "Generating setup checklist...",
+                     ChecklistGenerator, f"{event_type}_checklist.md"))
+
+    if len(jobs) == 1:
+        name, message, gen_cls, filename = jobs[0]
+        print(message)
+        path = run_generator(gen_cls, event, str(out / filename))
+        generated.append((name, path))
         print(f"  -> {path}")
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = []
+            for name, message, gen_cls, filename in jobs:
+                print(message)
+                futures.append(
+                    (name, pool.submit(run_generator, gen_cls, event, str(out / filename)))
+                )
+            # Collect in submission order so the output list is stable
+            # regardless of which generator finishes first. If a generator
+            # fails, the others still run and write their files before its
+            # exception is re-raised here.
+            for name, future in futures:
+                path = future.result()
+                generated.append((name, path))
+                print(f"  -> {path}")
 
     # Summary
     print(f"\n{'=' * 60}")
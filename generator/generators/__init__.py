@@ -1,8 +1,15 @@
 # Event Template System - Generator Modules
-from .companion_generator import CompanionGenerator
-from .qlab_generator import QLabGenerator
-from .touchdesigner_generator import TouchDesignerGenerator
-from .checklist_generator import ChecklistGenerator
+#
+# Generators are imported lazily on first attribute access, so importing a
+# single submodule (as generate.py does for --only) doesn't load the rest.
+import importlib
+
+_EXPORTS = {
+    "CompanionGenerator": ".companion_generator",
+    "QLabGenerator": ".qlab_generator",
+    "TouchDesignerGenerator": ".touchdesigner_generator",
+    "ChecklistGenerator": ".checklist_generator",
+}
 
 __all__ = [
     "CompanionGenerator",
@@ -10,3 +17,12 @@ __all__ = [
     "TouchDesignerGenerator",
     "ChecklistGenerator",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
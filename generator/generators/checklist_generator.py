@@ -12,8 +12,11 @@ The checklist covers:
   - Post-show teardown
 """
 
+import io
 from datetime import datetime
-from typing import Any
+from typing import Any, TextIO
+
+from .cues import load_cues
 
 
 class ChecklistGenerator:
@@ -21,39 +24,55 @@ class ChecklistGenerator:
 
     def __init__(self, event_data: dict):
         self.event = event_data
+        self._cues = load_cues(event_data, type_default="unknown")
+        # Header values are fixed for the lifetime of the generator
+        self._date = datetime.now().strftime("%Y-%m-%d")
+        self._version = (event_data.get("metadata") or {}).get("version", "1.0")
+        self._event_name = event_data.get("event_name", "Untitled Event")
 
     def generate(self) -> str:
         """Generate the complete checklist as Markdown."""
-        sections = [
-            self._header(),
-            self._hardware_setup(),
-            self._network_setup(),
-            self._software_config(),
-            self._sound_check(),
-            self._video_check(),
-            self._lighting_check(),
-            self._show_time(),
-            self._post_show(),
-            self._emergency_contacts(),
-        ]
-        return "\n".join(sections)
+        buf = io.StringIO()
+        self.generate_into(buf)
+        return buf.getvalue()
+
+    def generate_into(self, fp: TextIO) -> None:
+        """Write the complete checklist as Markdown to an open text stream.
+
+        Sections are written one at a time, so the full document is never
+        held in memory.
+        """
+        sections = (
+            self._header,
+            self._hardware_setup,
+            self._network_setup,
+            self._software_config,
+            self._sound_check,
+            self._video_check,
+            self._lighting_check,
+            self._show_time,
+            self._post_show,
+            self._emergency_contacts,
+        )
+        fp.write(sections[0]())
+        for section in sections[1:]:
+            fp.write("\n")
+            fp.write(section())
 
     def _header(self) -> str:
-        event_name = self.event.get("event_name", "Untitled Event")
         event_type = self.event.get("event_type", "unknown")
         venue = self.event.get("venue", "TBD")
         performers = self.event.get("performers", {}).get("count", 0)
-        date = datetime.now().strftime("%Y-%m-%d")
 
-        return f"""# Setup Checklist: {event_name}
+        return f"""# Setup Checklist: {self._event_name}
 
 | Field | Value |
 |-------|-------|
 | Event Type | `{event_type}` |
 | Venue | {venue} |
 | Performers | {performers} |
-| Generated | {date} |
-| Template Version | {self.event.get("metadata", {}).get("version", "1.0")} |
+| Generated | {self._date} |
+| Template Version | {self._version} |
 
 ---
 
@@ -63,12 +82,8 @@ class ChecklistGenerator:
         mics = self.event.get("audio", {}).get("microphones", [])
         cameras = self.event.get("video", {}).get("cameras", [])
 
-        lines = [
-            "## 1. Hardware Setup",
-            "",
-            "### Audio",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write("## 1. Hardware Setup\n\n### Audio\n\n")
 
         for mic in mics:
             mic_id = mic.get("id", "unknown")
@@ -76,65 +91,76 @@ class ChecklistGenerator:
             model = mic.get("model", "TBD")
             channel = mic.get("input_channel", "?")
             performer = mic.get("performer", "TBD")
-            lines.append(f"- [ ] **{mic_id}** ({mic_type}): {model}")
-            lines.append(f"  - Assigned to: {performer}")
-            lines.append(f"  - Input channel: {channel}")
-            lines.append(f"  - Battery check: fresh batteries installed")
+            buf.write(
+                f"- [ ] **{mic_id}** ({mic_type}): {model}\n"
+                f"  - Assigned to: {performer}\n"
+                f"  - Input channel: {channel}\n"
+                f"  - Battery check: fresh batteries installed\n"
+            )
 
         recording = self.event.get("audio", {}).get("recording", {})
         if recording.get("enabled"):
-            lines.append(f"- [ ] Audio recording configured ({recording.get('format', 'wav')}, {recording.get('sample_rate', 48000)}Hz)")
+            buf.write(f"- [ ] Audio recording configured ({recording.get('format', 'wav')}, {recording.get('sample_rate', 48000)}Hz)\n")
 
-        lines.append("")
-        lines.append("### Video")
-        lines.append("")
+        buf.write("\n### Video\n\n")
 
         for cam in cameras:
             cam_id = cam.get("id", "unknown")
             position = cam.get("position", "TBD")
             shot = cam.get("shot", "TBD")
             resolution = cam.get("resolution", "1080p")
-            lines.append(f"- [ ] **{cam_id}** positioned at {position}")
-            lines.append(f"  - Shot type: {shot}")
-            lines.append(f"  - Resolution: {resolution}")
-            lines.append(f"  - Focus and framing verified")
+            buf.write(
+                f"- [ ] **{cam_id}** positioned at {position}\n"
+                f"  - Shot type: {shot}\n"
+                f"  - Resolution: {resolution}\n"
+                f"  - Focus and framing verified\n"
+            )
 
         vid_recording = self.event.get("video", {}).get("recording", {})
         if vid_recording.get("enabled"):
-            lines.append(f"- [ ] Video recording configured ({vid_recording.get('format', 'h264')}, {vid_recording.get('bitrate', '20Mbps')})")
+            buf.write(f"- [ ] Video recording configured ({vid_recording.get('format', 'h264')}, {vid_recording.get('bitrate', '20Mbps')})\n")
 
-        lines.append("")
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _network_setup(self) -> str:
-        network = self.event.get("network", {})
-        hub = network.get("hub", {})
-        qlab = network.get("qlab", {})
-        companion = network.get("companion", {})
-        td = network.get("touchdesigner", {})
-        lighting = network.get("lighting_console", {})
+        network = self.event.get("network") or {}
+        hub = network.get("hub") or {}
+        qlab = network.get("qlab") or {}
+        companion = network.get("companion") or {}
+        td = network.get("touchdesigner") or {}
+        lighting = network.get("lighting_console") or {}
+
+        hub_host = hub.get("host", "127.0.0.1")
+        hub_port = hub.get("port", 9000)
+        qlab_host = qlab.get("host", "127.0.0.1")
+        qlab_port = qlab.get("port", 53000)
+        companion_host = companion.get("host", "127.0.0.1")
+        companion_port = companion.get("port", 8000)
+        td_port = td.get("osc_listen_port", 12000)
+        lighting_host = lighting.get("host", "TBD")
+        lighting_port = lighting.get("port", "TBD")
+        lighting_protocol = lighting.get("protocol", "OSC")
 
         return f"""## 2. Network Configuration
 
 - [ ] All devices on same network / VLAN
-- [ ] Production Hub running at `{hub.get("host", "127.0.0.1")}:{hub.get("port", 9000)}`
-- [ ] Hub dashboard accessible at `http://{hub.get("host", "127.0.0.1")}:8080/`
+- [ ] Production Hub running at `{hub_host}:{hub_port}`
+- [ ] Hub dashboard accessible at `http://{hub_host}:8080/`
 - [ ] All hub drivers connected (check `/health` endpoint)
-- [ ] QLab machine reachable at `{qlab.get("host", "127.0.0.1")}:{qlab.get("port", 53000)}`
-- [ ] Companion reachable at `{companion.get("host", "127.0.0.1")}:{companion.get("port", 8000)}`
-- [ ] TouchDesigner OSC listening on port `{td.get("osc_listen_port", 12000)}`
-- [ ] Lighting console at `{lighting.get("host", "TBD")}:{lighting.get("port", "TBD")}` ({lighting.get("protocol", "OSC")})
+- [ ] QLab machine reachable at `{qlab_host}:{qlab_port}`
+- [ ] Companion reachable at `{companion_host}:{companion_port}`
+- [ ] TouchDesigner OSC listening on port `{td_port}`
+- [ ] Lighting console at `{lighting_host}:{lighting_port}` ({lighting_protocol})
 - [ ] Firewall rules allow OSC traffic (UDP) between all devices
 - [ ] Network switch / router powered and verified
 
 """
 
     def _software_config(self) -> str:
-        network = self.event.get("network", {})
-        hub = network.get("hub", {})
-        qlab_passcode = network.get("qlab", {}).get("passcode", "1234")
-        hub_port = hub.get("port", 9000)
-        td_port = network.get("touchdesigner", {}).get("osc_listen_port", 12000)
+        network = self.event.get("network") or {}
+        hub_port = (network.get("hub") or {}).get("port", 9000)
+        qlab_passcode = (network.get("qlab") or {}).get("passcode", "1234")
+        td_port = (network.get("touchdesigner") or {}).get("osc_listen_port", 12000)
 
         return f"""## 3. Software Configuration
 
@@ -169,106 +195,101 @@ class ChecklistGenerator:
     def _sound_check(self) -> str:
         mics = self.event.get("audio", {}).get("microphones", [])
 
-        lines = [
-            "## 4. Sound Check",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write("## 4. Sound Check\n\n")
 
         for mic in mics:
             mic_id = mic.get("id", "unknown")
             performer = mic.get("performer", "TBD")
             gain = mic.get("gain_db", -12)
             channel = mic.get("input_channel", "?")
-            lines.append(f"- [ ] **{mic_id}** ({performer})")
-            lines.append(f"  - Channel {channel} signal present")
-            lines.append(f"  - Gain at {gain}dB, adjust to taste")
-            lines.append(f"  - No feedback at performance levels")
-            lines.append(f"  - Monitor mix set for performer")
-
-        lines.append("- [ ] Main mix balanced")
-        lines.append("- [ ] Recording levels verified (peaks below -6dB)")
-        lines.append("- [ ] Mute/unmute cues tested from Companion")
-        lines.append("")
-
-        return "\n".join(lines)
+            buf.write(
+                f"- [ ] **{mic_id}** ({performer})\n"
+                f"  - Channel {channel} signal present\n"
+                f"  - Gain at {gain}dB, adjust to taste\n"
+                f"  - No feedback at performance levels\n"
+                f"  - Monitor mix set for performer\n"
+            )
+
+        buf.write(
+            "- [ ] Main mix balanced\n"
+            "- [ ] Recording levels verified (peaks below -6dB)\n"
+            "- [ ] Mute/unmute cues tested from Companion\n"
+        )
+
+        return buf.getvalue()
 
     def _video_check(self) -> str:
         cameras = self.event.get("video", {}).get("cameras", [])
 
-        lines = [
-            "## 5. Video Check",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write("## 5. Video Check\n\n")
 
         for cam in cameras:
             cam_id = cam.get("id", "unknown")
             shot = cam.get("shot", "TBD")
-            lines.append(f"- [ ] **{cam_id}** ({shot} shot)")
-            lines.append(f"  - Image quality verified")
-            lines.append(f"  - White balance set")
-            lines.append(f"  - Focus locked")
+            buf.write(
+                f"- [ ] **{cam_id}** ({shot} shot)\n"
+                f"  - Image quality verified\n"
+                f"  - White balance set\n"
+                f"  - Focus locked\n"
+            )
 
-        lines.append("- [ ] Video switch tested (all camera cuts clean)")
-        lines.append("- [ ] Recording test: start/stop verified")
-        lines.append("- [ ] Output feed confirmed on program monitor")
-        lines.append("")
+        buf.write(
+            "- [ ] Video switch tested (all camera cuts clean)\n"
+            "- [ ] Recording test: start/stop verified\n"
+            "- [ ] Output feed confirmed on program monitor\n"
+        )
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _lighting_check(self) -> str:
-        presets = self.event.get("lighting", {}).get("presets", [])
-
-        lines = [
-            "## 6. Lighting Check",
-            "",
-            f"- [ ] Lighting console: {self.event.get('lighting', {}).get('controller', 'TBD')}",
-            f"- [ ] Universe: {self.event.get('lighting', {}).get('universe', 1)}",
-            "",
-        ]
+        lighting = self.event.get("lighting") or {}
+        presets = lighting.get("presets", [])
+        controller = lighting.get("controller", "TBD")
+        universe = lighting.get("universe", 1)
+
+        buf = io.StringIO()
+        buf.write(
+            "## 6. Lighting Check\n\n"
+            f"- [ ] Lighting console: {controller}\n"
+            f"- [ ] Universe: {universe}\n\n"
+        )
 
         for preset in presets:
             name = preset.get("name", "Unknown")
             desc = preset.get("description", "")
-            lines.append(f"- [ ] Preset **{name}** verified")
+            buf.write(f"- [ ] Preset **{name}** verified\n")
             if desc:
-                lines.append(f"  - {desc}")
+                buf.write(f"  - {desc}\n")
 
-        lines.append("- [ ] All lighting cues fire correctly from QLab/Companion")
-        lines.append("- [ ] Fade times feel appropriate")
-        lines.append("")
+        buf.write(
+            "- [ ] All lighting cues fire correctly from QLab/Companion\n"
+            "- [ ] Fade times feel appropriate\n"
+        )
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _show_time(self) -> str:
-        cues = self.event.get("cues", [])
-
-        lines = [
-            "## 7. Show Time Checklist",
-            "",
-            "### 15 Minutes Before",
-            "- [ ] All systems powered and stable",
-            "- [ ] Recording media has sufficient space",
-            "- [ ] Companion page on Show Control",
-            "- [ ] QLab playhead on first cue",
-            "",
-            "### 5 Minutes Before",
-            "- [ ] House to half (cue ready)",
-            "- [ ] Performers miked and in position",
-            "- [ ] Stage manager confirms ready",
-            "",
-            "### Cue Sequence",
-            "",
-        ]
-
-        for cue in cues:
-            number = cue.get("number", "???")
-            name = cue.get("name", "Untitled")
-            timing = cue.get("timing", "manual")
-            cue_type = cue.get("type", "unknown")
-            lines.append(f"- [ ] **Q{number}** {name} [{cue_type}] @ {timing}")
-
-        lines.append("")
-        return "\n".join(lines)
+        buf = io.StringIO()
+        buf.write(
+            "## 7. Show Time Checklist\n\n"
+            "### 15 Minutes Before\n"
+            "- [ ] All systems powered and stable\n"
+            "- [ ] Recording media has sufficient space\n"
+            "- [ ] Companion page on Show Control\n"
+            "- [ ] QLab playhead on first cue\n\n"
+            "### 5 Minutes Before\n"
+            "- [ ] House to half (cue ready)\n"
+            "- [ ] Performers miked and in position\n"
+            "- [ ] Stage manager confirms ready\n\n"
+            "### Cue Sequence\n\n"
+        )
+
+        for cue in self._cues:
+            buf.write(f"- [ ] **Q{cue.number}** {cue.name} [{cue.type}] @ {cue.timing}\n")
+
+        return buf.getvalue()
 
     def _post_show(self) -> str:
         return """## 8. Post-Show
@@ -304,7 +325,6 @@ class ChecklistGenerator:
 
     def write(self, output_path: str) -> str:
         """Generate and write the checklist to a Markdown file."""
-        checklist = self.generate()
         with open(output_path, "w") as f:
-            f.write(checklist)
+            self.generate_into(f)
         return output_path
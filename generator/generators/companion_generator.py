@@ -9,29 +9,77 @@ Produces a .companionconfig-compatible JSON structure with:
   - Page layout organized by show phase (pre-show, show, post-show)
 """
 
+import functools
 import json
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson  # optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+from .cues import Cue, load_cues
+
+
+def _rgb(r: int, g: int, b: int) -> int:
+    """Pack an RGB triple into Companion's decimal color value."""
+    return r | (g << 8) | (b << 16)
+
 
 # Button color palette (decimal RGB values for Companion)
 # Companion stores colors as: R + (G * 256) + (B * 65536)
 COLORS = {
-    "lighting":   {"bg": 204 + (153 * 256) + (0 * 65536),    "text": 0},              # amber
-    "audio":      {"bg": 0 + (153 * 256) + (204 * 65536),    "text": 0},              # teal
-    "video":      {"bg": 51 + (102 * 256) + (204 * 65536),   "text": 16777215},       # blue
-    "system":     {"bg": 153 + (51 * 256) + (153 * 65536),   "text": 16777215},       # purple
-    "go":         {"bg": 0 + (204 * 256) + (0 * 65536),      "text": 0},              # green
-    "stop":       {"bg": 204 + (0 * 256) + (0 * 65536),      "text": 16777215},       # red
-    "header":     {"bg": 40 + (40 * 256) + (40 * 65536),     "text": 16777215},       # dark gray
-    "blank":      {"bg": 0,                                    "text": 5592405},        # black/gray
+    "lighting":   {"bg": _rgb(204, 153, 0),    "text": _rgb(0, 0, 0)},          # amber
+    "audio":      {"bg": _rgb(0, 153, 204),    "text": _rgb(0, 0, 0)},          # teal
+    "video":      {"bg": _rgb(51, 102, 204),   "text": _rgb(255, 255, 255)},    # blue
+    "system":     {"bg": _rgb(153, 51, 153),   "text": _rgb(255, 255, 255)},    # purple
+    "go":         {"bg": _rgb(0, 204, 0),      "text": _rgb(0, 0, 0)},          # green
+    "stop":       {"bg": _rgb(204, 0, 0),      "text": _rgb(255, 255, 255)},    # red
+    "header":     {"bg": _rgb(40, 40, 40),     "text": _rgb(255, 255, 255)},    # dark gray
+    "blank":      {"bg": _rgb(0, 0, 0),        "text": _rgb(85, 85, 85)},       # black/gray
+}
+
+
+# OSC action for a hub_action's first arg, keyed by exact type. bool is a
+# subclass of int and is sent as an integer; anything else is a string.
+_ARG_ACTIONS = {
+    float: "osc:send_float",
+    int: "osc:send_integer",
+    bool: "osc:send_integer",
 }
 
+# Show-control layout: cue timing -> phase (anything else is "show"), and
+# the first grid row for each phase's cues
+_PHASE_BY_TIMING = {"pre-show": "pre", "post-show": "post"}
+_PHASE_ROWS = (("pre", 1), ("show", 2), ("post", 3))
+
+
+@functools.lru_cache(maxsize=64)
+def _style_template(style: str, size: str) -> MappingProxyType:
+    """Return the shared, read-only button style for a (style, size) pair.
+
+    Callers copy it and fill in "text" per button.
+    """
+    palette = COLORS.get(style, COLORS["blank"])
+    return MappingProxyType({
+        "text": "",
+        "size": f"{size}px",
+        "color": palette["text"],
+        "bgcolor": palette["bg"],
+        "alignment": "center",
+        "show_topbar": style != "header",
+        "textExpression": False,
+    })
+
 
 class CompanionGenerator:
     """Generates Companion page configuration from an event definition."""
 
     def __init__(self, event_data: dict):
         self.event = event_data
+        self._cues = load_cues(event_data, type_default="system")
         self.grid_cols = 8  # Stream Deck XL / standard layout
         self.grid_rows = 4
 
@@ -45,6 +93,10 @@ class CompanionGenerator:
         # Page 2: Camera & Audio direct controls
         pages["page_2"] = self._build_av_control_page()
 
+        # Pages key buttons by (row, col) internally; Companion expects "row,col"
+        for page in pages.values():
+            page["buttons"] = {f"{r},{c}": b for (r, c), b in page["buttons"].items()}
+
         config = {
             "version": "4.2.0",
             "type": "page_export",
@@ -59,56 +111,35 @@ class CompanionGenerator:
     def _build_show_control_page(self) -> dict:
         """Build the main show control page with cue buttons."""
         buttons = {}
-        cues = self.event.get("cues", [])
+        cues = self._cues
 
         # Row 0: Header row
-        buttons["0,0"] = self._make_button(
+        buttons[(0, 0)] = self._make_button(
             text=f"{self.event.get('event_name', 'Show')}\nCONTROL",
             style="header", size="14"
         )
-        buttons["0,1"] = self._make_button(text="PRE-SHOW", style="header", size="14")
-        buttons["0,4"] = self._make_button(text="SHOW", style="header", size="14")
-        buttons["0,6"] = self._make_button(text="POST-SHOW", style="header", size="14")
+        buttons[(0, 1)] = self._make_button(text="PRE-SHOW", style="header", size="14")
+        buttons[(0, 4)] = self._make_button(text="SHOW", style="header", size="14")
+        buttons[(0, 6)] = self._make_button(text="POST-SHOW", style="header", size="14")
 
         # GO and STOP buttons in top-right
-        buttons["0,2"] = self._make_go_button()
-        buttons["0,3"] = self._make_stop_button()
+        buttons[(0, 2)] = self._make_go_button()
+        buttons[(0, 3)] = self._make_stop_button()
+
+        if not cues:
+            return {
+                "name": "Show Control",
+                "gridSize": {"columns": self.grid_cols, "rows": self.grid_rows},
+                "buttons": buttons,
+            }
 
         # Distribute cues across rows 1-3
-        pre_show = [c for c in cues if c.get("timing") == "pre-show"]
-        show_cues = [c for c in cues if c.get("timing") not in ("pre-show", "post-show")]
-        post_show = [c for c in cues if c.get("timing") == "post-show"]
-
-        col = 0
-        row = 1
-
-        # Pre-show cues
-        for cue in pre_show:
-            if col >= self.grid_cols:
-                col = 0
-                row += 1
-            buttons[f"{row},{col}"] = self._make_cue_button(cue)
-            col += 1
-
-        # Show cues
-        col = 0
-        row = 2
-        for cue in show_cues:
-            if col >= self.grid_cols:
-                col = 0
-                row += 1
-            buttons[f"{row},{col}"] = self._make_cue_button(cue)
-            col += 1
+        buckets = {"pre": [], "show": [], "post": []}
+        for cue in cues:
+            buckets[_PHASE_BY_TIMING.get(cue.timing, "show")].append(cue)
 
-        # Post-show cues
-        col = 0
-        row = 3
-        for cue in post_show:
-            if col >= self.grid_cols:
-                col = 0
-                row += 1
-            buttons[f"{row},{col}"] = self._make_cue_button(cue)
-            col += 1
+        for phase, row in _PHASE_ROWS:
+            self._place(buckets[phase], row, buttons)
 
         return {
             "name": "Show Control",
@@ -116,24 +147,36 @@ class CompanionGenerator:
             "buttons": buttons,
         }
 
+    def _place(self, cues: list, start_row: int, buttons: dict) -> None:
+        """Lay out cue buttons left to right from start_row, wrapping rows."""
+        cols = self.grid_cols
+        col = 0
+        row = start_row
+        for cue in cues:
+            if col >= cols:
+                col = 0
+                row += 1
+            buttons[(row, col)] = self._make_cue_button(cue)
+            col += 1
+
     def _build_av_control_page(self) -> dict:
         """Build the AV direct control page."""
         buttons = {}
 
         # Row 0: Header
-        buttons["0,0"] = self._make_button(
+        buttons[(0, 0)] = self._make_button(
             text="A/V\nCONTROL", style="header", size="14"
         )
 
         # Camera buttons (row 1)
-        buttons["1,0"] = self._make_button(text="CAMERAS", style="header", size="12")
+        buttons[(1, 0)] = self._make_button(text="CAMERAS", style="header", size="12")
         cameras = self.event.get("video", {}).get("cameras", [])
         for i, cam in enumerate(cameras):
             cam_id = cam.get("id", f"cam{i+1}")
             shot = cam.get("shot", "")
             # Scene name derives from camera id: cam1 -> Camera1
             scene_name = cam_id.replace("cam", "Camera")
-            buttons[f"1,{i+1}"] = self._make_button(
+            buttons[(1, i + 1)] = self._make_button(
                 text=f"{cam_id.upper()}\n{shot}",
                 style="video",
                 size="14",
@@ -150,13 +193,13 @@ class CompanionGenerator:
             )
 
         # Audio buttons (row 2) — mute toggle via two steps
-        buttons["2,0"] = self._make_button(text="AUDIO", style="header", size="12")
+        buttons[(2, 0)] = self._make_button(text="AUDIO", style="header", size="12")
         mics = self.event.get("audio", {}).get("microphones", [])
         for i, mic in enumerate(mics):
             mic_id = mic.get("id", f"mic{i+1}")
             channel = mic.get("input_channel", i + 1)
             mute_path = f"/avantis/ch/{channel}/mix/mute"
-            buttons[f"2,{i+1}"] = self._make_button(
+            buttons[(2, i + 1)] = self._make_button(
                 text=f"{mic_id.upper()}\nMUTE",
                 style="audio",
                 size="14",
@@ -168,7 +211,7 @@ class CompanionGenerator:
             # Add an unmute button next to the mute button
             unmute_col = i + 1 + len(mics)
             if unmute_col < self.grid_cols:
-                buttons[f"2,{unmute_col}"] = self._make_button(
+                buttons[(2, unmute_col)] = self._make_button(
                     text=f"{mic_id.upper()}\nUNMUTE",
                     style="go",
                     size="14",
@@ -179,14 +222,14 @@ class CompanionGenerator:
                 )
 
         # Lighting presets (row 3)
-        buttons["3,0"] = self._make_button(text="LIGHTING", style="header", size="12")
+        buttons[(3, 0)] = self._make_button(text="LIGHTING", style="header", size="12")
         presets = self.event.get("lighting", {}).get("presets", [])
         for i, preset in enumerate(presets[:7]):  # max 7 to fit row
             preset_name = preset.get("name", f"Preset {i+1}")
             exec_num = i + 1
             # Wrap long names
             display = preset_name.replace(" ", "\n") if len(preset_name) > 10 else preset_name
-            buttons[f"3,{i+1}"] = self._make_button(
+            buttons[(3, i + 1)] = self._make_button(
                 text=display,
                 style="lighting",
                 size="11",
@@ -202,12 +245,12 @@ class CompanionGenerator:
             "buttons": buttons,
         }
 
-    def _make_cue_button(self, cue: dict) -> dict:
+    def _make_cue_button(self, cue: Cue) -> dict:
         """Create a button for a specific cue."""
-        cue_type = cue.get("type", "system")
-        cue_number = cue.get("number", "???")
-        cue_name = cue.get("name", "Untitled")
-        hub_actions = cue.get("hub_actions", [])
+        cue_type = cue.type
+        cue_number = cue.number
+        cue_name = cue.name
+        hub_actions = cue.hub_actions
 
         # Truncate name for button display
         display_name = cue_name[:16]
@@ -239,14 +282,10 @@ class CompanionGenerator:
             args = ha.get("args")
             if args is not None and len(args) > 0:
                 arg = args[0]
-                if isinstance(arg, float):
-                    actions.append({
-                        "actionId": "osc:send_float",
-                        "options": {"path": address, "value": arg},
-                    })
-                elif isinstance(arg, int):
+                action_id = _ARG_ACTIONS.get(type(arg))
+                if action_id is not None:
                     actions.append({
-                        "actionId": "osc:send_integer",
+                        "actionId": action_id,
                         "options": {"path": address, "value": arg},
                     })
                 else:
@@ -285,20 +324,13 @@ class CompanionGenerator:
         actions: list | None = None,
     ) -> dict:
         """Create a generic Companion button object."""
-        palette = COLORS.get(style, COLORS["blank"])
+        button_style = dict(_style_template(style, size))
+        button_style["text"] = text
 
         button = {
             "type": "button",
             "enabled": True,
-            "style": {
-                "text": text,
-                "size": f"{size}px",
-                "color": palette["text"],
-                "bgcolor": palette["bg"],
-                "alignment": "center",
-                "show_topbar": style != "header",
-                "textExpression": False,
-            },
+            "style": button_style,
             "steps": {},
             "feedbacks": [],
         }
@@ -330,6 +362,13 @@ class CompanionGenerator:
     def write(self, output_path: str) -> str:
         """Generate and write the Companion config to a JSON file."""
         config = self.generate()
-        with open(output_path, "w") as f:
-            json.dump(config, f, indent=2)
+        # The two paths produce equivalent JSON, but not always identical
+        # bytes: orjson formats some floats differently (1e-05 -> 0.00001).
+        if orjson is not None:
+            Path(output_path).write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            # Match orjson: write non-ASCII text as UTF-8 rather than \u escapes
+            Path(output_path).write_text(
+                json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
         return output_path
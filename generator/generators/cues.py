@@ -0,0 +1,33 @@
+"""
+Cue View
+========
+Read-only view of an event's cue list, shared by the generators that
+walk every cue.
+
+Defaults for missing fields are applied once here instead of through
+repeated ``cue.get(...)`` calls in each generator. Generators fall back
+to different cue types, so the caller supplies ``type_default``; an
+explicit ``type: null`` or ``type: ""`` is kept as-is.
+"""
+
+from collections import namedtuple
+
+
+Cue = namedtuple("Cue", "number name type timing hub_actions")
+
+
+def load_cues(event_data: dict, type_default: str) -> list:
+    """Build a Cue for every entry in the event's cue list.
+
+    ``type_default`` is used only for cues without a ``type`` key.
+    """
+    return [
+        Cue(
+            c.get("number", "???"),
+            c.get("name", "Untitled"),
+            c.get("type", type_default),
+            c.get("timing", "manual"),
+            c.get("hub_actions") or (),
+        )
+        for c in event_data.get("cues", [])
+    ]
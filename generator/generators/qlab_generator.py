@@ -12,6 +12,7 @@ The generated script:
   - Includes timing delays between commands to let QLab process
 """
 
+from pathlib import Path
 from typing import Any
 
 
@@ -468,7 +469,5 @@ if __name__ == "__main__":
 
     def write(self, output_path: str) -> str:
         """Generate and write the QLab script to a file."""
-        script = self.generate()
-        with open(output_path, "w") as f:
-            f.write(script)
+        Path(output_path).write_text(self.generate())
         return output_path
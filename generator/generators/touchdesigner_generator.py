@@ -12,6 +12,7 @@ The generated script:
   - Configures output resolution and format
 """
 
+from pathlib import Path
 from typing import Any
 
 
@@ -314,7 +315,5 @@ build_network()
 
     def write(self, output_path: str) -> str:
         """Generate and write the TouchDesigner script to a file."""
-        script = self.generate()
-        with open(output_path, "w") as f:
-            f.write(script)
+        Path(output_path).write_text(self.generate())
         return output_path